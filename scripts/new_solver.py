@@ -10,8 +10,10 @@ Generates new solution files for Advent of Code challenges, including:
 **This script was created with the help of Claude AI.**
 """
 
-import argparse
+import bisect
 import logging
+import re
+import string
 import sys
 from pathlib import Path
 from typing import List, Tuple
@@ -20,8 +22,10 @@ MIN_YEAR = 2015
 MAX_YEAR = 2025
 MAX_DAYS = 25
 
-# Easily modifiable template for new solution files
-RUST_SOLUTION_TEMPLATE = """use advent_of_code_data as aoc;
+# Easily modifiable template for new solution files. Uses `string.Template`
+# placeholders (`${day}`) so the Rust braces don't need escaping.
+RUST_SOLUTION_TEMPLATE = string.Template(
+    """use advent_of_code_data as aoc;
 use yuletide as yt;
 
 use linkme::distributed_slice;
@@ -29,32 +33,38 @@ use linkme::distributed_slice;
 use crate::SOLVERS;
 
 #[distributed_slice(SOLVERS)]
-static SOLVER: yt::SolverAutoRegister = yt::SolverAutoRegister {{
+static SOLVER: yt::SolverAutoRegister = yt::SolverAutoRegister {
     modpath: std::module_path!(),
-    part_one: yt::SolverPart {{
-        func: day_{day}_1,
-        examples: &[/*yt::Example {{
+    part_one: yt::SolverPart {
+        func: day_${day}_1,
+        examples: &[/*yt::Example {
             input: "",
             expected: aoc::Answer::Int(0),
-        }}*/],
-    }},
-    part_two: yt::SolverPart {{
-        func: day_{day}_2,
-        examples: &[/*yt::Example {{
+        }*/],
+    },
+    part_two: yt::SolverPart {
+        func: day_${day}_2,
+        examples: &[/*yt::Example {
             input: "",
             expected: aoc::Answer::Int(0),
-        }}*/],
-    }},
-}};
+        }*/],
+    },
+};
 
-pub fn day_{day}_1(args: &yt::SolverArgs) -> yt::Result<aoc::Answer> {{ 
+pub fn day_${day}_1(args: &yt::SolverArgs) -> yt::Result<aoc::Answer> { 
     Err(yt::SolverError::NotFinished)
-}}
+}
 
-pub fn day_{day}_2(_args: &yt::SolverArgs) -> yt::Result<aoc::Answer> {{
+pub fn day_${day}_2(_args: &yt::SolverArgs) -> yt::Result<aoc::Answer> {
     Err(yt::SolverError::NotFinished)
-}}
+}
 """
+)
+
+# Matches `mod day{N};` and `mod y{YEAR};` declarations on their own line.
+_MOD_DAY_RE = re.compile(rb"(?m)^[ \t]*mod[ \t]+day(\d+)[ \t]*;[ \t\r]*$")
+_MOD_YEAR_RE = re.compile(rb"(?m)^[ \t]*mod[ \t]+y(\d+)[ \t]*;[ \t\r]*$")
+_BLANK_LINE_RE = re.compile(rb"(?m)^[ \t\r]*$")
 
 
 def setup_logging() -> None:
@@ -62,8 +72,21 @@ def setup_logging() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
+def parse_args() -> Tuple[int, int]:
+    """
+    Parse command-line arguments.
+
+    Returns:
+        Tuple of (year, day)
+    """
+    # Fast path for the common `new_solver.py YEAR DAY` invocation, which
+    # skips importing and building an argparse parser
+    argv = sys.argv[1:]
+    if len(argv) == 2 and argv[0].isdecimal() and argv[1].isdecimal():
+        return int(argv[0]), int(argv[1])
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate new Advent of Code solution files"
     )
@@ -94,11 +117,7 @@ def parse_args() -> argparse.Namespace:
     if year is None or day is None:
         parser.error("Both year and day are required")
 
-    # Update namespace with final values
-    args.year = year
-    args.day = day
-
-    return args
+    return year, day
 
 
 def validate_inputs(year: int, day: int) -> None:
@@ -132,55 +151,49 @@ def create_solution_file(year: int, day: int) -> bool:
     year_dir = Path("src") / f"y{year}"
     solution_file = year_dir / f"day{day}.rs"
 
-    # Check if solution file already exists
-    if solution_file.exists():
-        raise FileExistsError(f"Solution file already exists: {solution_file}")
-
-    # Track if this is a new year
-    is_new_year = not year_dir.exists()
-
-    # Create year directory if needed
-    year_dir.mkdir(parents=True, exist_ok=True)
-    if is_new_year:
+    # Create year directory if needed, tracking if this is a new year
+    try:
+        year_dir.mkdir(parents=True)
+        is_new_year = True
         logging.info(f"Created directory: {year_dir}")
+    except FileExistsError:
+        is_new_year = False
 
-    # Write solution file
-    content = RUST_SOLUTION_TEMPLATE.format(year=year, day=day)
-    solution_file.write_text(content)
+    # Write solution file, letting exclusive create mode fail if it exists
+    content = RUST_SOLUTION_TEMPLATE.substitute(day=day)
+    try:
+        with solution_file.open("x") as f:
+            f.write(content)
+    except FileExistsError:
+        raise FileExistsError(
+            f"Solution file already exists: {solution_file}"
+        ) from None
     logging.info(f"Created solution file: {solution_file}")
 
     return is_new_year
 
 
-def parse_mod_declarations(lines: List[str]) -> List[int]:
+def parse_mod_declarations(data: bytes) -> List[int]:
     """
     Parse mod declarations from mod.rs to extract day numbers.
 
     Args:
-        lines: Lines from the mod.rs file
+        data: Contents of the mod.rs file
 
     Returns:
-        List of day numbers found in mod declarations
+        List of day numbers found in mod declarations, in file order
     """
-    days = []
-    for line in lines:
-        line = line.strip()
-        if line.startswith("mod day") and line.endswith(";"):
-            # Extract day number from "mod day{N};"
-            day_str = line[7:-1]  # Remove "mod day" prefix and ";" suffix
-            try:
-                days.append(int(day_str))
-            except ValueError:
-                # Skip malformed lines
-                continue
-    return days
+    return [int(d) for d in _MOD_DAY_RE.findall(data)]
 
 
 def update_mod_file(year: int, day: int) -> None:
     """
     Update (or create) the mod.rs file for the given year.
 
-    Adds the mod declaration for the new day and sorts all declarations.
+    Adds the mod declaration for the new day. When the existing declarations
+    are already in numeric order and the new day comes after all of them the
+    declaration is appended, otherwise all declarations are rewritten in
+    sorted order.
 
     Args:
         year: The year for the solution
@@ -191,66 +204,68 @@ def update_mod_file(year: int, day: int) -> None:
 
     # Read existing mod declarations if file exists
     if mod_file.exists():
-        lines = mod_file.read_text().splitlines()
-        days = parse_mod_declarations(lines)
+        data = mod_file.read_bytes()
+        declared_days = parse_mod_declarations(data)
     else:
-        days = []
+        data = b""
+        declared_days = []
         logging.info(f"Creating new mod file: {mod_file}")
 
-    # Add new day if not present
-    if day in days:
+    # rustfmt orders mod declarations lexicographically (day1, day10, day2...)
+    # so the file order can't be relied on to be numeric
+    days = sorted(declared_days)
+    in_numeric_order = days == declared_days
+
+    # Leave the file (and its mtime) alone if the day is already declared,
+    # otherwise insert it in sorted position
+    idx = bisect.bisect_left(days, day)
+    if idx < len(days) and days[idx] == day:
         logging.info(f"Day {day} already present in {mod_file}")
-    else:
-        days.append(day)
+        return
+    elif idx == len(days) and in_numeric_order:
+        # Days are usually solved in order, so append instead of rewriting
+        with mod_file.open("ab") as f:
+            if data and not data.endswith(b"\n"):
+                f.write(b"\n")
+            f.write(b"mod day%d;\n" % day)
         logging.info(f"Added 'mod day{day};' to {mod_file}")
+        return
 
-    # Sort days naturally (1, 2, ..., 10, not lexicographic)
-    days.sort()
+    days.insert(idx, day)
+    logging.info(f"Added 'mod day{day};' to {mod_file}")
 
     # Write sorted mod declarations
-    content = "\n".join(f"mod day{d};" for d in days) + "\n"
-    mod_file.write_text(content)
+    content = b"".join([b"mod day%d;\n" % d for d in days])
+    mod_file.write_bytes(content)
 
 
-def parse_year_mods(lines: List[str]) -> Tuple[List[int], int]:
+def parse_year_mods(data: bytes) -> Tuple[List[int], int]:
     """
     Parse year mod declarations from main.rs.
 
+    Only the declarations before the first blank line are considered.
+
     Args:
-        lines: Lines from main.rs
+        data: Contents of main.rs
 
     Returns:
-        Tuple of (list of years, index of first blank line)
+        Tuple of (sorted list of years, byte offset of first blank line)
     """
-    years = []
-    blank_line_idx = 0
-
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
+    blank_line = _BLANK_LINE_RE.search(data)
+    blank_line_offset = blank_line.start() if blank_line else 0
+    header_end = blank_line_offset if blank_line else len(data)
 
-        # Stop at first blank line
-        if not stripped:
-            blank_line_idx = idx
-            break
-
-        # Parse year mod declarations
-        if stripped.startswith("mod y") and stripped.endswith(";"):
-            # Extract year from "mod y{YEAR};"
-            year_str = stripped[5:-1]  # Remove "mod y" prefix and ";" suffix
-            try:
-                years.append(int(year_str))
-            except ValueError:
-                # Skip malformed lines
-                continue
-
-    return years, blank_line_idx
+    years = sorted(int(y) for y in _MOD_YEAR_RE.findall(data, 0, header_end))
+    return years, blank_line_offset
 
 
 def update_main_file(year: int) -> None:
     """
     Update src/main.rs to include the new year module.
 
-    Adds the year mod declaration and sorts all year declarations.
+    Adds the year mod declaration. When the new year comes after every
+    existing year the declaration is inserted just before the first blank
+    line, otherwise all year declarations are rewritten in sorted order.
 
     Args:
         year: The year to add
@@ -261,29 +276,37 @@ def update_main_file(year: int) -> None:
         logging.error(f"main.rs not found at {main_file}")
         raise FileNotFoundError(f"Expected main.rs at {main_file}")
 
-    # Read main.rs
-    lines = main_file.read_text().splitlines()
-
-    # Parse year mods
-    years, blank_line_idx = parse_year_mods(lines)
+    # Read and parse year mods from main.rs
+    data = main_file.read_bytes()
+    years, blank_line_offset = parse_year_mods(data)
 
-    # Add new year if not present
-    if year in years:
+    # Insert new year in sorted position if not present
+    idx = bisect.bisect_left(years, year)
+    if idx < len(years) and years[idx] == year:
         logging.info(f"Year {year} already present in {main_file}")
         return
 
-    years.append(year)
     logging.info(f"Added 'mod y{year};' to {main_file}")
 
-    # Sort years
-    years.sort()
+    if idx == len(years) and blank_line_offset > 0:
+        # Years are usually added in order, so splice in the new declaration
+        # without rebuilding the existing ones
+        new_content = (
+            data[:blank_line_offset]
+            + b"mod y%d;\n" % year
+            + data[blank_line_offset:]
+        )
+        main_file.write_bytes(new_content)
+        return
+
+    years.insert(idx, year)
 
     # Reconstruct file: year mods + blank line + rest
-    year_mod_lines = [f"mod y{y};" for y in years]
-    rest_of_file = lines[blank_line_idx:]
+    year_mod_lines = b"".join([b"mod y%d;\n" % y for y in years])
+    rest_of_file = data[blank_line_offset:]
 
-    new_content = "\n".join(year_mod_lines) + "\n" + "\n".join(rest_of_file)
-    main_file.write_text(new_content)
+    new_content = year_mod_lines + rest_of_file
+    main_file.write_bytes(new_content)
 
 
 def main() -> int:
@@ -293,16 +316,15 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    # Parse arguments before configuring logging so `--help` and usage errors
+    # exit without paying for it
+    year, day = parse_args()
     setup_logging()
 
     try:
-        # Parse and validate arguments
-        args = parse_args()
-        year = args.year
-        day = args.day
-
         logging.info(f"Creating solution for year {year}, day {day}")
 
+        # Validate arguments
         validate_inputs(year, day)
 
         # Create solution file and track if new year